@@ -10,6 +10,7 @@ See COPYING and COPYING.LESSER for license details.
 """
 import csv
 import logging
+import math
 import os
 import pathlib
 import time
@@ -29,6 +30,23 @@ from pyglui import pyfontstash, ui
 from pyglui.cygl import utils as cygl_utils
 from raw_data_exporter import _Base_Positions_Exporter
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is an optional acceleration; the kernels below run as plain
+    # Python (slower but identical results) when it is not installed.
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,10 +59,14 @@ def glfont_generator():
 
 
 def get_limits(data, keys):
-    limits = (
-        min(data[key].min() if data[key].shape[0] else 0 for key in keys),
-        max(data[key].max() if data[key].shape[0] else 1 for key in keys),
-    )
+    columns = [data[key] for key in keys if data[key].shape[0]]
+    if columns:
+        # one SIMD-backed reduction over all columns at once instead of
+        # per-key Python min/max
+        stacked = np.stack(columns)
+        limits = (float(stacked.min()), float(stacked.max()))
+    else:
+        limits = (0, 1)
     # If the difference between the lower and upper bound is too small,
     # OpenGL will start throwing errors.
     limit_min_diff = 0.001
@@ -53,46 +75,275 @@ def get_limits(data, keys):
     return limits
 
 
-def fuser(data_raw, gyro_error):
+@njit(cache=True, fastmath=True)
+def _madgwick_batch(accel, gyro_rad, state, beta, sample_dur, pitch_out, roll_out):
+    """Advance the Madgwick fusion state over a batch of samples.
+
+    Mirrors ``Fusion.update`` but runs the whole loop in compiled code when
+    numba is available. ``accel`` and ``gyro_rad`` are (N, 3) arrays, ``state``
+    holds the quaternion plus the last pitch/roll (updated in place, so
+    orientation carries across successive batches) and per-sample pitch/roll
+    are written to the output arrays.
+    """
+    q1 = state[0]
+    q2 = state[1]
+    q3 = state[2]
+    q4 = state[3]
+    pitch = state[4]
+    roll = state[5]
+
+    for i in range(accel.shape[0]):
+        ax = accel[i, 0]
+        ay = accel[i, 1]
+        az = accel[i, 2]
+        gx = gyro_rad[i, 0]
+        gy = gyro_rad[i, 1]
+        gz = gyro_rad[i, 2]
+
+        # Auxiliary variables to avoid repeated arithmetic
+        _2q1 = 2 * q1
+        _2q2 = 2 * q2
+        _2q3 = 2 * q3
+        _2q4 = 2 * q4
+        _4q1 = 4 * q1
+        _4q2 = 4 * q2
+        _4q3 = 4 * q3
+        _8q2 = 8 * q2
+        _8q3 = 8 * q3
+        q1q1 = q1 * q1
+        q2q2 = q2 * q2
+        q3q3 = q3 * q3
+        q4q4 = q4 * q4
+
+        # Normalise accelerometer measurement
+        norm_sq = ax * ax + ay * ay + az * az
+        if norm_sq == 0:
+            # handle NaN; keep previous orientation for this sample
+            pitch_out[i] = pitch
+            roll_out[i] = roll
+            continue
+        # reciprocal sqrt; under fastmath LLVM emits rsqrt + Newton step
+        norm = 1.0 / math.sqrt(norm_sq)
+        ax *= norm
+        ay *= norm
+        az *= norm
+
+        # Gradient decent algorithm corrective step
+        s1 = _4q1 * q3q3 + _2q3 * ax + _4q1 * q2q2 - _2q2 * ay
+        s2 = (
+            _4q2 * q4q4
+            - _2q4 * ax
+            + 4 * q1q1 * q2
+            - _2q1 * ay
+            - _4q2
+            + _8q2 * q2q2
+            + _8q2 * q3q3
+            + _4q2 * az
+        )
+        s3 = (
+            4 * q1q1 * q3
+            + _2q1 * ax
+            + _4q3 * q4q4
+            - _2q4 * ay
+            - _4q3
+            + _8q3 * q2q2
+            + _8q3 * q3q3
+            + _4q3 * az
+        )
+        s4 = 4 * q2q2 * q4 - _2q2 * ax + 4 * q3q3 * q4 - _2q3 * ay
+        norm = 1 / math.sqrt(
+            s1 * s1 + s2 * s2 + s3 * s3 + s4 * s4
+        )  # normalise step magnitude
+        s1 *= norm
+        s2 *= norm
+        s3 *= norm
+        s4 *= norm
+
+        # Compute rate of change of quaternion
+        q_dot1 = 0.5 * (-q2 * gx - q3 * gy - q4 * gz) - beta * s1
+        q_dot2 = 0.5 * (q1 * gx + q3 * gz - q4 * gy) - beta * s2
+        q_dot3 = 0.5 * (q1 * gy - q2 * gz + q4 * gx) - beta * s3
+        q_dot4 = 0.5 * (q1 * gz + q2 * gy - q3 * gx) - beta * s4
+
+        # Integrate to yield quaternion
+        q1 += q_dot1 * sample_dur
+        q2 += q_dot2 * sample_dur
+        q3 += q_dot3 * sample_dur
+        q4 += q_dot4 * sample_dur
+        norm = 1 / math.sqrt(
+            q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4
+        )  # normalise quaternion
+        q1 *= norm
+        q2 *= norm
+        q3 *= norm
+        q4 *= norm
+
+        # These are modified to account for Invisible IMU coordinate system
+        # and positioning of the IMU within the invisible headset
+        roll = math.degrees(-math.asin(2.0 * (q2 * q4 - q1 * q3))) + 7
+        # bring to range [-180, 180]
+        roll = ((roll + 180) % 360) - 180
+
+        pitch = (
+            math.degrees(
+                math.atan2(
+                    2.0 * (q1 * q2 + q3 * q4),
+                    q1 * q1 - q2 * q2 - q3 * q3 + q4 * q4,
+                )
+            )
+            + 90
+        )
+        # bring to range [-180, 180]
+        pitch = ((pitch + 180) % 360) - 180
+
+        pitch_out[i] = pitch
+        roll_out[i] = roll
+
+    state[0] = q1
+    state[1] = q2
+    state[2] = q3
+    state[3] = q4
+    state[4] = pitch
+    state[5] = roll
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _madgwick_batch_streams(
+    accel, gyro_rad, offsets, start, stop, state, beta, sample_dur, pitch_out, roll_out
+):
+    """Advance several independent fusion states over one window of samples.
+
+    The streams are stored back to back in ``accel``/``gyro_rad`` with stream
+    boundaries given by ``offsets``; ``state`` holds one fusion state row per
+    stream. Samples ``start:stop`` (stream-local indices) of every stream are
+    processed in one call, with the streams distributed across cores. Each
+    stream writes to disjoint slices, so no state is shared between threads.
+    """
+    for s in prange(offsets.shape[0] - 1):
+        begin = offsets[s] + start
+        end = min(offsets[s] + stop, offsets[s + 1])
+        if begin >= end:
+            continue
+        _madgwick_batch(
+            accel[begin:end],
+            gyro_rad[begin:end],
+            state[s],
+            beta,
+            sample_dur,
+            pitch_out[begin:end],
+            roll_out[begin:end],
+        )
+
+
+FUSER_CHUNK_SIZE = 1024
+
+
+def fuser(gyro, accel, offsets, gyro_error):
     yield "Fusing imu", ()
-    fusion = Fusion(gyro_error, 0.00494)
 
-    for ind, datum in enumerate(data_raw):
-        gyro_x, gyro_y, gyro_z, accel_x, accel_y, accel_z = datum
-        fusion.update((accel_x, accel_y, accel_z), (gyro_x, gyro_y, gyro_z))
-        yield "Fusing imu", ()
-        yield "Fused datum", ((fusion.pitch, fusion.roll), ind)
+    # gyro/accel arrive as contiguous (N, 3) float32 SoA buffers; convert the
+    # gyro readings to radians in a single ufunc call.
+    gyro_rad = np.radians(gyro)
+
+    num_samples = len(accel)
+    num_streams = len(offsets) - 1
+    # float32 throughout: matches the sensor precision and DTYPE_RAW, and
+    # halves the bytes moved through the kernel
+    beta = np.float32(math.sqrt(3.0 / 4.0) * math.radians(gyro_error))
+    sample_dur = np.float32(0.00494)
+    # one fusion state row (quaternion + last pitch/roll) per independent
+    # IMU recording
+    state = np.tile(
+        np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0], dtype=np.float32),
+        (num_streams, 1),
+    )
+    pitch = np.empty(num_samples, dtype=np.float32)
+    roll = np.empty(num_samples, dtype=np.float32)
+    max_stream_len = int(np.diff(offsets).max()) if num_streams else 0
+
+    # Run the compiled kernel chunk-wise so that progress can be reported
+    # through the generator protocol while the bulk of the work stays in
+    # compiled code.
+    last_pct = 0
+    for start in range(0, max_stream_len, FUSER_CHUNK_SIZE):
+        stop = min(start + FUSER_CHUNK_SIZE, max_stream_len)
+        _madgwick_batch_streams(
+            accel, gyro_rad, offsets, start, stop, state, beta, sample_dur, pitch, roll
+        )
+        # coalesce status updates to ~1% granularity; a status message per
+        # chunk would only add IPC traffic
+        pct = 100 * stop // max_stream_len
+        if pct > last_pct:
+            yield f"Fusing imu ({pct}%)", ()
+            last_pct = pct
+        # Ship whole chunks across the IPC boundary; one message per chunk
+        # and stream instead of one per sample.
+        for s in range(num_streams):
+            begin = offsets[s] + start
+            end = min(offsets[s] + stop, offsets[s + 1])
+            if begin >= end:
+                continue
+            yield "Fused chunk", (
+                pitch[begin:end].copy(),
+                roll[begin:end].copy(),
+                begin,
+            )
 
     yield "Fusion complete", ()
 
 
-def merge_arrays(arr1, arr2):
-    NEW_DTYPE = [
-        ("gyro_x", "<f4"),
-        ("gyro_y", "<f4"),
-        ("gyro_z", "<f4"),
-        ("accel_x", "<f4"),
-        ("accel_y", "<f4"),
-        ("accel_z", "<f4"),
-        ("pitch", "<f4"),
-        ("roll", "<f4"),
-    ]
-    new_array = np.empty(len(arr1), dtype=NEW_DTYPE).view(np.recarray)
+class ImuColumns:
+    """Zero-copy, column-oriented stand-in for the merged export recarray.
 
-    for key in arr1.dtype.names:
-        new_array[key] = arr1[key]
+    Exposes the interface the export path needs (length, key lookup, slicing
+    and reordering) while every column stays backed by the original raw and
+    orientation arrays instead of being copied into a new recarray.
+    """
+
+    def __init__(self, columns):
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            # e.g. a stale orientation cache that does not match the raw data
+            raise ValueError("All columns require the same length")
+        self._columns = columns
+        self._len = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_raw_and_orient(cls, data_raw, orient_columns):
+        columns = {key: data_raw[key] for key in data_raw.dtype.names}
+        columns.update(orient_columns)
+        return cls(columns)
 
-    for key in arr2.dtype.names:
-        new_array[key] = arr2[key]
+    def keys(self):
+        return self._columns.keys()
 
-    return new_array
+    def copy(self):
+        return type(self)({name: col.copy() for name, col in self._columns.items()})
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, (int, np.integer)):
+            # single datum, as handed out by Bisector.__getitem__/by_ts
+            return {name: col[key] for name, col in self._columns.items()}
+        # slice or index array: apply to each column individually
+        return type(self)({name: col[key] for name, col in self._columns.items()})
+
+    def __iter__(self):
+        for ind in range(self._len):
+            yield {name: col[ind] for name, col in self._columns.items()}
 
 
 class Fusion:
     """
     Class provides sensor fusion estimating pitch and roll using Madgwick's algorithm:
     https://www.x-io.co.uk/res/doc/madgwick_internal_report.pdf
-    The update method must be called periodically.
+    The update method must be called periodically with gyro readings that have
+    already been converted to rad/s; callers should convert whole arrays with
+    a single np.radians call instead of per sample.
     Original code available at: https://github.com/micropython-IMU/micropython-fusion
     Refactored by Neil M. Thomas (https://github.com/N-M-T) 10.01.2020
     Released under the MIT License (MIT)
@@ -116,20 +367,26 @@ class Fusion:
 
     def __init__(self, gyro_error, sample_dur):
         self.sample_dur = sample_dur  # Time between updates
-        self.q = [1.0, 0.0, 0.0, 0.0]  # vector to hold quaternion
-        gyro_mean_error = np.radians(gyro_error)
+        # quaternion state as four scalars to avoid per-sample list indexing
+        self.q1 = 1.0
+        self.q2 = 0.0
+        self.q3 = 0.0
+        self.q4 = 0.0
+        gyro_mean_error = math.radians(gyro_error)
         self.beta = (
-            np.sqrt(3.0 / 4.0) * gyro_mean_error
+            math.sqrt(3.0 / 4.0) * gyro_mean_error
         )  # compute beta (see README in original github page)
         self.pitch = 0
         self.roll = 0
 
-    def update(self, accel, gyro):  # 2-tuples (x, y, z) for accel, gyro
+    def update(self, accel, gyro):  # (x, y, z) for accel, gyro
         ax, ay, az = accel  # Units G (but later normalised)
-        gx, gy, gz = (np.radians(x) for x in gyro)  # Units deg/s
-        q1, q2, q3, q4 = (
-            self.q[x] for x in range(4)
-        )  # short name local variable for readability
+        gx, gy, gz = gyro  # Units rad/s (pre-converted by the caller)
+        # short name local variables for readability
+        q1 = self.q1
+        q2 = self.q2
+        q3 = self.q3
+        q4 = self.q4
         # Auxiliary variables to avoid repeated arithmetic
         _2q1 = 2 * q1
         _2q2 = 2 * q2
@@ -146,10 +403,10 @@ class Fusion:
         q4q4 = q4 * q4
 
         # Normalise accelerometer measurement
-        norm = np.sqrt(ax * ax + ay * ay + az * az)
-        if norm == 0:
+        norm_sq = ax * ax + ay * ay + az * az
+        if norm_sq == 0:
             return  # handle NaN
-        norm = 1 / norm  # use reciprocal for division
+        norm = 1.0 / math.sqrt(norm_sq)  # use reciprocal for division
         ax *= norm
         ay *= norm
         az *= norm
@@ -177,7 +434,7 @@ class Fusion:
             + _4q3 * az
         )
         s4 = 4 * q2q2 * q4 - _2q2 * ax + 4 * q3q3 * q4 - _2q3 * ay
-        norm = 1 / np.sqrt(
+        norm = 1 / math.sqrt(
             s1 * s1 + s2 * s2 + s3 * s3 + s4 * s4
         )  # normalise step magnitude
         s1 *= norm
@@ -196,30 +453,28 @@ class Fusion:
         q2 += q_dot2 * self.sample_dur
         q3 += q_dot3 * self.sample_dur
         q4 += q_dot4 * self.sample_dur
-        norm = 1 / np.sqrt(
+        norm = 1 / math.sqrt(
             q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4
         )  # normalise quaternion
-        self.q = q1 * norm, q2 * norm, q3 * norm, q4 * norm
-
-        # These are modified to account for Invisible IMU coordinate system and positioning of
-        # the IMU within the invisible headset
-        roll = (
-            np.degrees(
-                -np.arcsin(2.0 * (self.q[1] * self.q[3] - self.q[0] * self.q[2]))
-            )
-            + 7
-        )
+        q1 *= norm
+        q2 *= norm
+        q3 *= norm
+        q4 *= norm
+
+        # Compute the angles directly from the normalised locals; no
+        # intermediate tuple or attribute round-trips, and math.* avoids
+        # per-call ufunc dispatch on scalars.
+        # These are modified to account for Invisible IMU coordinate system
+        # and positioning of the IMU within the invisible headset
+        roll = math.degrees(-math.asin(2.0 * (q2 * q4 - q1 * q3))) + 7
         # bring to range [-180, 180]
         self.roll = ((roll + 180) % 360) - 180
 
         pitch = (
-            np.degrees(
-                np.arctan2(
-                    2.0 * (self.q[0] * self.q[1] + self.q[2] * self.q[3]),
-                    self.q[0] * self.q[0]
-                    - self.q[1] * self.q[1]
-                    - self.q[2] * self.q[2]
-                    + self.q[3] * self.q[3],
+            math.degrees(
+                math.atan2(
+                    2.0 * (q1 * q2 + q3 * q4),
+                    q1 * q1 - q2 * q2 - q3 * q3 + q4 * q4,
                 )
             )
             + 90
@@ -227,6 +482,11 @@ class Fusion:
         # bring to range [-180, 180]
         self.pitch = ((pitch + 180) % 360) - 180
 
+        self.q1 = q1
+        self.q2 = q2
+        self.q3 = q3
+        self.q4 = q4
+
 
 class IMURecording:
     DTYPE_RAW = np.dtype(
@@ -253,9 +513,22 @@ class IMURecording:
             return
 
         self.ts = np.load(str(self.path_ts))
-        self.raw = np.fromfile(str(self.path_raw), dtype=self.DTYPE_RAW).view(
-            np.recarray
-        )
+        # Map only the complete records; an interrupted recording can leave a
+        # partial record at the end of the file, which np.memmap would reject
+        # without an explicit shape.
+        num_records = self.path_raw.stat().st_size // self.DTYPE_RAW.itemsize
+        if num_records:
+            # Map the raw sensor file instead of reading it whole; pages are
+            # only faulted in when the data is actually touched. Downstream
+            # code indexes fields by key, so no recarray view is needed.
+            self.raw = np.memmap(
+                str(self.path_raw),
+                dtype=self.DTYPE_RAW,
+                mode="r",
+                shape=(num_records,),
+            )
+        else:
+            self.raw = np.empty(0, dtype=self.DTYPE_RAW)
         num_ts_during_init = self.ts.size - len(self.raw)
         if num_ts_during_init > 0:
             self.ts = self.ts[num_ts_during_init:]
@@ -360,6 +633,7 @@ class IMUTimeline(Plugin):
         self.should_draw_orientation = should_draw_orientation
 
         self.bg_task = None
+        self._pending_export = None
 
         self.gyro_timeline = None
         self.accel_timeline = None
@@ -369,12 +643,28 @@ class IMUTimeline(Plugin):
 
         self.data_raw = np.concatenate([rec.raw for rec in imu_recs])
         self.data_ts = np.concatenate([rec.ts for rec in imu_recs])
+        # boundaries of the independent per-file streams within data_raw
+        self.stream_offsets = np.cumsum([0] + [len(rec.raw) for rec in imu_recs])
         self.data_len = len(self.data_raw)
-        self.data_orient = self.data_orient_empty_copy()
+        # orientation is kept as two plain contiguous arrays (SoA); plotting
+        # reads whole columns, which an AoS recarray would serve with
+        # strided-by-8 loads
+        self._pitch = np.empty(0, dtype=np.float32)
+        self._roll = np.empty(0, dtype=np.float32)
         self.read_orientation_cache()
         self.gyro_keys = ["gyro_x", "gyro_y", "gyro_z"]
         self.accel_keys = ["accel_x", "accel_y", "accel_z"]
         self.orient_keys = ["pitch", "roll"]
+        # y-limits per key group; computed lazily and invalidated when the
+        # orientation data changes, so redraws do not rescan the full dataset
+        self._limits_cache = {}
+        # contiguous per-key float32 columns for plotting; built once so that
+        # redraws never touch the structured dtype field machinery
+        self._plot_cache = {
+            key: np.ascontiguousarray(self.data_raw[key])
+            for key in self.gyro_keys + self.accel_keys
+        }
+        self._refresh_plot_cache_orient()
 
     def get_init_dict(self):
         return {
@@ -441,8 +731,9 @@ class IMUTimeline(Plugin):
         if self.should_draw_orientation:
             self.append_timeline_orientation()
 
-        if self.data_orient.shape[0] == 0:
-            # Start fusion after setting up timelines
+        if self.should_draw_orientation and self._pitch.shape[0] == 0:
+            # Start fusion after setting up timelines; fusion is lazy and is
+            # skipped entirely while the orientation timeline stays hidden
             self._fuse()
 
     def deinit_ui(self):
@@ -472,20 +763,34 @@ class IMUTimeline(Plugin):
         if self.bg_task:
             self.bg_task.cancel()
 
+        # Convert the recarray to SoA buffers once here; iterating structured
+        # dtype fields sample-by-sample in the worker is pathologically slow,
+        # and plain float32 arrays are also cheaper to ship across the IPC
+        # boundary.
+        gyro = np.stack([self.data_raw[key] for key in self.gyro_keys], axis=1)
+        accel = np.stack([self.data_raw[key] for key in self.accel_keys], axis=1)
         generator_args = (
-            self.data_raw,
+            gyro,
+            accel,
+            self.stream_offsets,
             self.gyro_error,
         )
 
-        self.data_orient = self.data_orient_empty_copy()
-        self._data_orient_fetched = np.empty_like(self.data_orient, shape=self.data_len)
+        self._pitch = np.empty(0, dtype=np.float32)
+        self._roll = np.empty(0, dtype=np.float32)
+        self._pitch_fetched = np.empty(self.data_len, dtype=np.float32)
+        self._roll_fetched = np.empty(self.data_len, dtype=np.float32)
+        self._fused_count = 0
+        self._limits_cache.pop(tuple(self.orient_keys), None)
+        self._refresh_plot_cache_orient()
         if self.should_draw_orientation:
             self.orient_timeline.refresh()
         logger.info("Starting IMU fusion using Madgwick's algorithm")
         self.bg_task = bh.IPC_Logging_Task_Proxy("Fusion", fuser, args=generator_args)
 
-    def data_orient_empty_copy(self):
-        return np.empty([0], dtype=self.DTYPE_ORIENT).view(np.recarray)
+    def _refresh_plot_cache_orient(self):
+        self._plot_cache["pitch"] = self._pitch
+        self._plot_cache["roll"] = self._roll
 
     def recent_events(self, events):
         if self.bg_task:
@@ -495,10 +800,14 @@ class IMUTimeline(Plugin):
             for progress, task_data in self.bg_task.fetch():
                 self.status = progress
                 if task_data:
-                    current_progress = task_data[1] / self.data_len
-                    self.menu_icon.indicator_stop = current_progress
-                    self._data_orient_fetched["pitch"][task_data[1]] = task_data[0][0]
-                    self._data_orient_fetched["roll"][task_data[1]] = task_data[0][1]
+                    chunk_pitch, chunk_roll, start = task_data
+                    stop = start + len(chunk_pitch)
+                    self._pitch_fetched[start:stop] = chunk_pitch
+                    self._roll_fetched[start:stop] = chunk_roll
+                    # chunks arrive interleaved across streams, so count
+                    # fused samples instead of using the chunk's end offset
+                    self._fused_count += len(chunk_pitch)
+                    self.menu_icon.indicator_stop = self._fused_count / self.data_len
                 if time.perf_counter() - start_time > 1 / 50:
                     did_timeout = True
                     break
@@ -508,13 +817,21 @@ class IMUTimeline(Plugin):
                 self.bg_task = None
                 self.menu_icon.indicator_stop = 0.0
                 # swap orientation data buffers
-                self.data_orient = self._data_orient_fetched
-                del self._data_orient_fetched
+                self._pitch = self._pitch_fetched
+                self._roll = self._roll_fetched
+                del self._pitch_fetched
+                del self._roll_fetched
+                self._limits_cache.pop(tuple(self.orient_keys), None)
+                self._refresh_plot_cache_orient()
                 if self.should_draw_orientation:
                     # redraw new orientation data
                     self.orient_timeline.refresh()
                 self.write_orientation_cache()
                 logger.info("Madgwick's fusion completed")
+                if self._pending_export:
+                    export_window, export_dir = self._pending_export
+                    self._pending_export = None
+                    self.export_data(export_window, export_dir)
 
     def on_draw_raw_toggled(self, new_value):
         self.should_draw_raw = new_value
@@ -527,6 +844,9 @@ class IMUTimeline(Plugin):
         self.should_draw_orientation = new_value
         if self.should_draw_orientation:
             self.append_timeline_orientation()
+            if self._pitch.shape[0] == 0 and not self.bg_task:
+                # first time the orientation view is shown; fuse on demand
+                self._fuse()
         else:
             self.remove_timeline_orientation()
 
@@ -568,40 +888,41 @@ class IMUTimeline(Plugin):
         self.g_pool.user_timelines.remove(self.orient_timeline)
         del self.glfont_orient
 
+    def _cached_limits(self, keys):
+        cache_key = tuple(keys)
+        if cache_key not in self._limits_cache:
+            self._limits_cache[cache_key] = get_limits(self._plot_cache, keys)
+        return self._limits_cache[cache_key]
+
     def draw_raw_gyro(self, width, height, scale):
-        y_limits = get_limits(self.data_raw, self.gyro_keys)
-        self._draw_grouped(
-            self.data_raw, self.gyro_keys, y_limits, width, height, scale
-        )
+        y_limits = self._cached_limits(self.gyro_keys)
+        self._draw_grouped(self.gyro_keys, y_limits, width, height, scale)
 
     def draw_raw_accel(self, width, height, scale):
-        y_limits = get_limits(self.data_raw, self.accel_keys)
-        self._draw_grouped(
-            self.data_raw, self.accel_keys, y_limits, width, height, scale
-        )
+        y_limits = self._cached_limits(self.accel_keys)
+        self._draw_grouped(self.accel_keys, y_limits, width, height, scale)
 
     def draw_orient(self, width, height, scale):
-        y_limits = get_limits(self.data_orient, self.orient_keys)
-        self._draw_grouped(
-            self.data_orient, self.orient_keys, y_limits, width, height, scale
-        )
+        y_limits = self._cached_limits(self.orient_keys)
+        self._draw_grouped(self.orient_keys, y_limits, width, height, scale)
 
-    def _draw_grouped(self, data, keys, y_limits, width, height, scale):
+    def _draw_grouped(self, keys, y_limits, width, height, scale):
         ts_min = self.g_pool.timestamps[0]
         ts_max = self.g_pool.timestamps[-1]
-        data_raw = data[keys]
-        sub_samples = np.linspace(
-            0,
-            self.data_len - 1,
-            min(self.NUMBER_SAMPLES_TIMELINE, self.data_len),
-            dtype=int,
-        )
+        # Stride-slice instead of fancy-indexing: slicing returns views, so
+        # downsampling to NUMBER_SAMPLES_TIMELINE allocates nothing.
+        stride = max(1, self.data_len // self.NUMBER_SAMPLES_TIMELINE)
+        ts_sub = self.data_ts[::stride]
         with gl_utils.Coord_System(ts_min, ts_max, *y_limits):
             for key in keys:
-                data_keyed = data_raw[key]
+                data_keyed = self._plot_cache[key]
                 if data_keyed.shape[0] == 0:
                     continue
-                points = list(zip(self.data_ts[sub_samples], data_keyed[sub_samples]))
+                # contiguous (N, 2) float32 vertices; avoids materializing N
+                # Python tuples per key per redraw
+                points = np.empty((len(ts_sub), 2), dtype=np.float32)
+                points[:, 0] = ts_sub
+                points[:, 1] = data_keyed[::stride]
                 cygl_utils.draw_points(points, size=1.5 * scale, color=self.CMAP[key])
 
     def draw_legend_gyro(self, width, height, scale):
@@ -639,13 +960,21 @@ class IMUTimeline(Plugin):
         if notification["subject"] == "madgwick_fusion.should_fuse":
             self._fuse()
         elif notification["subject"] == "should_export":
-            if not self.bg_task:
-                self.export_data(notification["ts_window"], notification["export_dir"])
+            export_args = (notification["ts_window"], notification["export_dir"])
+            if self.bg_task:
+                logger.warning("Madgwick's algorithm still running, deferring export")
+                self._pending_export = export_args
+            elif self._pitch.shape[0] == 0:
+                # fusion was skipped so far; run it now and export afterwards
+                self._pending_export = export_args
+                self._fuse()
             else:
-                logger.warning("Running Madgwick's algorithm")
+                self.export_data(*export_args)
 
     def export_data(self, export_window, export_dir):
-        for_export = merge_arrays(self.data_raw, self.data_orient)
+        for_export = ImuColumns.from_raw_and_orient(
+            self.data_raw, {"pitch": self._pitch, "roll": self._roll}
+        )
 
         imu_bisector = Imu_Bisector(for_export, self.data_ts)
         imu_exporter = Imu_Exporter()
@@ -663,7 +992,12 @@ class IMUTimeline(Plugin):
             offline_data.mkdir()
         path_cache = offline_data / "orientation.cache"
         path_meta = offline_data / "orientation.meta"
-        np.save(path_cache, self.data_orient)
+        # cache keeps the structured layout for compatibility with existing
+        # cache files
+        data_orient = np.empty(len(self._pitch), dtype=self.DTYPE_ORIENT)
+        data_orient["pitch"] = self._pitch
+        data_orient["roll"] = self._roll
+        np.save(path_cache, data_orient)
         fm.save_object(
             {"version": self.CACHE_VERSION, "gyro_error": self.gyro_error}, path_meta
         )
@@ -679,7 +1013,9 @@ class IMUTimeline(Plugin):
         if meta["version"] != self.CACHE_VERSION:
             return False
         self.gyro_error = meta["gyro_error"]
-        self.data_orient = np.load(path_cache).view(np.recarray)
+        data_orient = np.load(path_cache)
+        self._pitch = np.ascontiguousarray(data_orient["pitch"])
+        self._roll = np.ascontiguousarray(data_orient["roll"])
         return True
 
 
@@ -703,10 +1039,15 @@ class Imu_Bisector(pm.Bisector):
             self.data_ts = data_ts
             self.data = data
 
-            # Find correct order once and reorder both lists in-place
-            self.sorted_idc = np.argsort(self.data_ts)
-            self.data_ts = self.data_ts[self.sorted_idc]
-            self.data = self.data[self.sorted_idc]
+            if np.all(np.diff(self.data_ts) >= 0):
+                # Timestamps are normally already monotonic; skip the sort
+                # and the per-column reindex in the common case.
+                self.sorted_idc = np.arange(len(self.data_ts))
+            else:
+                # Find correct order once and reorder both lists in-place
+                self.sorted_idc = np.argsort(self.data_ts, kind="stable")
+                self.data_ts = self.data_ts[self.sorted_idc]
+                self.data = self.data[self.sorted_idc]
 
 
 class Imu_Exporter(_Base_Positions_Exporter):
@@ -774,17 +1115,19 @@ class Imu_Exporter(_Base_Positions_Exporter):
         export_section = imu_bisector.init_dict_for_window(export_window)
         export_world_idc = pm.find_closest(timestamps, export_section["data_ts"])
 
+        data = export_section["data"]
         with open(export_path, "w", encoding="utf-8", newline="") as csvfile:
             csv_header = type(self).csv_export_labels()
-            dict_writer = csv.DictWriter(csvfile, fieldnames=csv_header)
-            dict_writer.writeheader()
-
-            for d_raw, wts, idx in zip(
-                export_section["data"], export_section["data_ts"], export_world_idc
-            ):
-                dict_row = type(self).dict_export(
-                    raw_value=d_raw, world_ts=wts, world_index=idx
+            writer = csv.writer(csvfile)
+            writer.writerow(csv_header)
+            if len(export_section["data_ts"]):
+                # Write whole columns at once; csv.writer drives the row loop
+                # in C instead of building one dict per row via dict_export.
+                # An empty window keeps the header-only file and skips the
+                # column lookups, which an empty bisector cannot serve.
+                columns = (data[key] for key in csv_header[2:])
+                writer.writerows(
+                    zip(export_section["data_ts"], export_world_idc, *columns)
                 )
-                dict_writer.writerow(dict_row)
 
         logger.info(f"Created '{export_file}' file.")